@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import declarative_base, relationship
 
 
@@ -12,17 +12,17 @@ class Document(Base):
     main_title = Column(String, nullable=False)
     eid = Column(String, nullable=False, unique=True, index=True)
 
-    titles = relationship('DocumentTitle', back_populates='document', cascade='all, delete-orphan')
-    authors = relationship('DocumentAuthorship', back_populates='document', cascade='all, delete-orphan')
+    titles = relationship('DocumentTitle', back_populates='document', cascade='all, delete-orphan', lazy='raise')
+    authors = relationship('DocumentAuthorship', back_populates='document', cascade='all, delete-orphan', lazy='raise')
 
-    pub_year = Column(Integer, nullable=False, index=True)
+    pub_year = Column(Integer, nullable=False)
 
     document_type = Column(String, nullable=True)
     publication_stage = Column(String, nullable=True)
     total_authors = Column(Integer, nullable=True)
 
     abstract_available = Column(Boolean, nullable=True)
-    abstract_texts = relationship('DocumentAbstractText', back_populates='document', cascade='all, delete-orphan')
+    abstract_texts = relationship('DocumentAbstractText', back_populates='document', cascade='all, delete-orphan', lazy='raise')
 
     citations_count = Column(Integer, nullable=True)
     references_count = Column(Integer, nullable=True)
@@ -30,68 +30,57 @@ class Document(Base):
     status_type = Column(String, nullable=True)
     free_to_read = Column(Boolean, nullable=True)
 
-    doi = Column(String, nullable=True, index=True)
-    pui = Column(String, nullable=True, index=True)
-    scopus_id_ = Column(String, nullable=True, index=True)
-    src_occ_id = Column(String, nullable=True, index=True)
-    reaxyscar = Column(String, nullable=True, index=True)
-    cpx = Column(String, nullable=True, index=True)
-    car_id = Column(String, nullable=True, index=True)
-    sgr = Column(String, nullable=True, index=True)
-    tpa_id = Column(String, nullable=True, index=True)
+    doi = Column(String, nullable=True)
+    pui = Column(String, nullable=True)
+    scopus_id_ = Column(String, nullable=True)
+    src_occ_id = Column(String, nullable=True)
+    reaxyscar = Column(String, nullable=True)
+    cpx = Column(String, nullable=True)
+    car_id = Column(String, nullable=True)
+    sgr = Column(String, nullable=True)
+    tpa_id = Column(String, nullable=True)
 
-    subject_areas = relationship('DocumentSubjectArea', back_populates='document', cascade='all, delete-orphan')
+    subject_areas = relationship('DocumentSubjectArea', back_populates='document', cascade='all, delete-orphan', lazy='raise')
 
     source_relationship = relationship(
-        'DocumentSourceRelationship', back_populates='document', cascade='all, delete-orphan'
+        'DocumentSourceRelationship', back_populates='document', cascade='all, delete-orphan', lazy='raise'
+    )
+    source = relationship('DocumentSource', back_populates='document', cascade='all, delete-orphan', lazy='raise')
+
+    __table_args__ = (
+        Index('ix_documents_pub_year_brin', 'pub_year', postgresql_using='brin'),
+    ) + tuple(
+        Index(f'ix_documents_{col_name}', col_name, postgresql_where=text(f'{col_name} IS NOT NULL'))
+        for col_name in ('doi', 'pui', 'scopus_id_', 'src_occ_id', 'reaxyscar', 'cpx', 'car_id', 'sgr', 'tpa_id')
     )
-    source = relationship('DocumentSource', back_populates='document', cascade='all, delete-orphan')
 
 
 class DocumentTitle(Base):
     __tablename__ = 'documents_titles'
 
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    document_id = Column(String, ForeignKey('documents.scopus_id'), primary_key=True)
+    document = relationship('Document', back_populates='titles', lazy='raise')
 
-    document_id = Column(String, ForeignKey('documents.scopus_id'), nullable=False, index=True)
-    document = relationship('Document', back_populates='titles')
-
-    title = Column(String, nullable=False, unique=True)
-
-    __table_args__ = (
-        UniqueConstraint('document_id', 'title', name='_document_title_uc'),
-    )
+    title = Column(String, primary_key=True)
 
 
 class DocumentAbstractText(Base):
     __tablename__ = 'documents_abstract_texts'
 
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    document_id = Column(String, ForeignKey('documents.scopus_id'), primary_key=True)
+    document = relationship('Document', back_populates='abstract_texts', lazy='raise')
 
-    document_id = Column(String, ForeignKey('documents.scopus_id'), nullable=False, index=True)
-    document = relationship('Document', back_populates='abstract_texts')
-
-    text = Column(Text, nullable=False, unique=True)
-
-    __table_args__ = (
-        UniqueConstraint('document_id', 'text', name='_document_abstract_text_uc'),
-    )
+    text = Column(Text, primary_key=True)
 
 
 class DocumentSubjectArea(Base):
     __tablename__ = 'documents_subject_areas'
 
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-
-    document_id = Column(String, ForeignKey('documents.scopus_id'), nullable=False, index=True)
-    document = relationship('Document', back_populates='subject_areas')
+    document_id = Column(String, ForeignKey('documents.scopus_id'), primary_key=True)
+    document = relationship('Document', back_populates='subject_areas', lazy='raise')
 
-    subject_area_code = Column(Integer, ForeignKey('subject_areas.code'), nullable=False, index=True)
-    subject_area = relationship('SubjectArea', back_populates='document', cascade='all')
-
-    __table_args__ = (
-        UniqueConstraint('document_id', 'subject_area_code', name='_document_subject_areas_uc'),
-    )
+    subject_area_code = Column(Integer, ForeignKey('subject_areas.code'), primary_key=True, index=True)
+    subject_area = relationship('SubjectArea', back_populates='document', cascade='all', lazy='raise')
 
 
 class DocumentSourceRelationship(Base):
@@ -100,7 +89,7 @@ class DocumentSourceRelationship(Base):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
 
     document_id = Column(String, ForeignKey('documents.scopus_id'), nullable=False, unique=True, index=True)
-    document = relationship('Document', back_populates='source_relationship')
+    document = relationship('Document', back_populates='source_relationship', lazy='raise')
 
     issue = Column(String, nullable=True)
     volume = Column(String, nullable=True)
@@ -118,10 +107,10 @@ class DocumentSource(Base):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
 
     document_id = Column(String, ForeignKey('documents.scopus_id'), unique=True, nullable=False, index=True)
-    document = relationship('Document', back_populates='source')
+    document = relationship('Document', back_populates='source', lazy='raise')
 
     source_id = Column(String, ForeignKey('sources.id'), nullable=False, index=True)
-    source = relationship('Source', back_populates='documents')
+    source = relationship('Source', back_populates='documents', lazy='raise')
 
 
 class Source(Base):
@@ -142,23 +131,17 @@ class Source(Base):
     isbn = Column(String, nullable=True, index=True)
     issnp = Column(String, nullable=True, index=True)
 
-    documents = relationship('DocumentSource', back_populates='source', cascade='all')
+    documents = relationship('DocumentSource', back_populates='source', cascade='all', lazy='raise')
 
 
 class DocumentAuthorship(Base):
     __tablename__ = 'documents_authorship'
 
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-
-    document_id = Column(String, ForeignKey('documents.scopus_id'), nullable=False, index=True)
-    document = relationship('Document', back_populates='authors', cascade='all')
-
-    author_id = Column(String, ForeignKey('authors.id'), nullable=False, index=True)
-    author = relationship('Author', back_populates='documents', cascade='all')
+    document_id = Column(String, ForeignKey('documents.scopus_id'), primary_key=True)
+    document = relationship('Document', back_populates='authors', cascade='all', lazy='raise')
 
-    __table_args__ = (
-        UniqueConstraint('document_id', 'author_id', name='_document_author_uc'),
-    )
+    author_id = Column(String, ForeignKey('authors.id'), primary_key=True, index=True)
+    author = relationship('Author', back_populates='documents', cascade='all', lazy='raise')
 
 
 class Author(Base):
@@ -171,12 +154,12 @@ class Author(Base):
     first_name = Column(String, nullable=False)
     last_name = Column(String, nullable=False)
     full_name = Column(String, nullable=False)
-    name_variants = relationship('AuthorNameVariant', back_populates='author', cascade='all, delete-orphan')
+    name_variants = relationship('AuthorNameVariant', back_populates='author', cascade='all, delete-orphan', lazy='raise')
 
     email_address = Column(String, nullable=True)
 
     affiliated_institution_id = Column(String, ForeignKey('authors_affiliated_institutions.id'), nullable=False, index=True)
-    affiliated_institution = relationship('AuthorAffiliatedInstitution',  back_populates='authors', cascade='all')
+    affiliated_institution = relationship('AuthorAffiliatedInstitution',  back_populates='authors', cascade='all', lazy='raise')
 
     document_count = Column(Integer, nullable=True, index=True)
     coauthors_count = Column(Integer, nullable=True, index=True)
@@ -186,41 +169,29 @@ class Author(Base):
     h_index = Column(Integer, nullable=True, index=True)
 
     subject_areas = relationship(
-        'AuthorSubjectArea', back_populates='author', cascade='all, delete-orphan'
+        'AuthorSubjectArea', back_populates='author', cascade='all, delete-orphan', lazy='raise'
     )
 
-    documents = relationship('DocumentAuthorship', back_populates='author', cascade='all')
+    documents = relationship('DocumentAuthorship', back_populates='author', cascade='all', lazy='raise')
 
 
 class AuthorNameVariant(Base):
     __tablename__ = 'authors_name_variants'
 
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-
-    author_id = Column(String, ForeignKey('authors.id'), nullable=False, index=True)
-    author = relationship('Author', back_populates='name_variants', cascade='all')
+    author_id = Column(String, ForeignKey('authors.id'), primary_key=True)
+    author = relationship('Author', back_populates='name_variants', cascade='all', lazy='raise')
 
-    name = Column(String, nullable=False)
-
-    __table_args__ = (
-        UniqueConstraint('author_id', 'name', name='_author_name_uc'),
-    )
+    name = Column(String, primary_key=True)
 
 
 class AuthorSubjectArea(Base):
     __tablename__ = 'authors_subject_areas'
 
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-
-    author_id = Column(String, ForeignKey('authors.id'), nullable=False, index=True)
-    author = relationship('Author', back_populates='subject_areas', cascade='all')
-
-    subject_area_codename = Column(String, ForeignKey('subject_areas.codename'), nullable=False, index=True)
-    subject_area = relationship('SubjectArea', back_populates='author', cascade='all')
+    author_id = Column(String, ForeignKey('authors.id'), primary_key=True)
+    author = relationship('Author', back_populates='subject_areas', cascade='all', lazy='raise')
 
-    __table_args__ = (
-        UniqueConstraint('author_id', 'subject_area_codename', name='_author_subject_area_uc'),
-    )
+    subject_area_codename = Column(String, ForeignKey('subject_areas.codename'), primary_key=True, index=True)
+    subject_area = relationship('SubjectArea', back_populates='author', cascade='all', lazy='raise')
 
 
 class AuthorAffiliatedInstitution(Base):
@@ -238,7 +209,7 @@ class AuthorAffiliatedInstitution(Base):
     postal_code = Column(String, nullable=True)
     street_address = Column(String, nullable=True)
 
-    authors = relationship('Author', back_populates='affiliated_institution', cascade='all')
+    authors = relationship('Author', back_populates='affiliated_institution', cascade='all', lazy='raise')
 
 
 class SubjectArea(Base):
@@ -247,10 +218,10 @@ class SubjectArea(Base):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
 
     code = Column(Integer, unique=True, nullable=True, index=True)
-    document = relationship('DocumentSubjectArea', back_populates='subject_area', cascade='all, delete-orphan')
+    document = relationship('DocumentSubjectArea', back_populates='subject_area', cascade='all, delete-orphan', lazy='raise')
 
     codename = Column(String, unique=True, nullable=True, index=True)
-    author = relationship('AuthorSubjectArea', back_populates='subject_area', cascade='all, delete-orphan')
+    author = relationship('AuthorSubjectArea', back_populates='subject_area', cascade='all, delete-orphan', lazy='raise')
 
     name = Column(String, unique=True, nullable=False)
 
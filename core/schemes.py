@@ -1,19 +1,39 @@
-from typing import Any, Dict, List, Optional, Union
+from itertools import repeat
+from typing import Annotated, Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple, Union
 
 from pydantic import (
-    BaseModel, ConfigDict, Field, field_validator, model_validator, NonNegativeInt, PositiveInt, ValidationError
+    BaseModel, BeforeValidator, Field, model_validator, NonNegativeInt, PositiveInt, StringConstraints, TypeAdapter,
+    ValidationError
 )
 
 
+StrippedStr = Annotated[str, StringConstraints(strip_whitespace=True)]
+
+_empty_str_to_none = BeforeValidator(lambda v: None if v == '' else v)
+EmptyStrToNone = Annotated[Optional[str], _empty_str_to_none]
+EmptyStrToNoneInt = Annotated[Optional[PositiveInt], _empty_str_to_none]
+
+
+def _merge_sub_dict(data: Dict, key: str) -> None:
+    sub = data.get(key)
+    if isinstance(sub, Dict):
+        data.update(sub)
+
+
 class _BaseModel(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True, coerce_numbers_to_str=True)
+    _insert_exclude: ClassVar[FrozenSet[str]] = frozenset()
+    _insert_fields_cache: ClassVar[Dict[type, Tuple[str, ...]]] = {}
 
-    @field_validator('*', mode='before')
-    def empty_value_to_none(cls, v: Any) -> Any:
-        if v == '':
-            return None
+    def to_insert_dict(self) -> Dict[str, Any]:
+        insert_fields = _BaseModel._insert_fields_cache.get(type(self))
+        if insert_fields is None:
+            insert_fields = tuple(
+                field_name for field_name in type(self).model_fields if field_name not in self._insert_exclude
+            )
+            _BaseModel._insert_fields_cache[type(self)] = insert_fields
 
-        return v
+        field_values = self.__dict__
+        return {field_name: field_values[field_name] for field_name in insert_fields}
 
 
 class SubjectArea(_BaseModel):
@@ -35,21 +55,19 @@ class SubjectArea(_BaseModel):
 
 
 class SourceRelationship(_BaseModel):
-    issue: Optional[str] = None
-    volume: Optional[str] = None
-    article_number: Optional[str] = Field(default=None, validation_alias='articleNumber')
+    issue: EmptyStrToNone = None
+    volume: EmptyStrToNone = None
+    article_number: EmptyStrToNone = Field(default=None, validation_alias='articleNumber')
 
-    page_count: Optional[PositiveInt] = Field(default=None, validation_alias='pageCount')
-    first_page: Optional[PositiveInt] = Field(default=None, validation_alias='pageFirst')
-    last_page: Optional[PositiveInt] = Field(default=None, validation_alias='pageLast')
-    info_page: Optional[PositiveInt] = Field(default=None, validation_alias='pageInfo')
+    page_count: EmptyStrToNoneInt = Field(default=None, validation_alias='pageCount')
+    first_page: EmptyStrToNoneInt = Field(default=None, validation_alias='pageFirst')
+    last_page: EmptyStrToNoneInt = Field(default=None, validation_alias='pageLast')
+    info_page: EmptyStrToNoneInt = Field(default=None, validation_alias='pageInfo')
 
     @model_validator(mode='before')
     def extract_pages_nums(cls, source_relationship_data: Any):
         if isinstance(source_relationship_data, dict):
-            pages_nums = source_relationship_data.get('pages', {}) or {}
-            if isinstance(pages_nums, dict):
-                source_relationship_data.update(pages_nums)
+            _merge_sub_dict(source_relationship_data, 'pages')
 
         return source_relationship_data
 
@@ -64,14 +82,18 @@ class Source(_BaseModel):
     publisher: Optional[str] = None
     is_active: Optional[bool] = Field(default=None, validation_alias='active')
 
-    issn: Optional[str] = None
-    coden: Optional[str] = None
-    eissn: Optional[str] = None
-    isbn: Optional[str] = None
-    issnp: Optional[str] = None
+    issn: EmptyStrToNone = None
+    coden: EmptyStrToNone = None
+    eissn: EmptyStrToNone = None
+    isbn: EmptyStrToNone = None
+    issnp: EmptyStrToNone = None
 
 
 class Document(_BaseModel):
+    _insert_exclude: ClassVar[FrozenSet[str]] = frozenset(
+        {'titles', 'authors_ids', 'abstract_texts', 'subject_areas', 'source_relationship', 'source'}
+    )
+
     scopus_id: str = Field(validation_alias='scopusId')
     main_title: str = Field(validate_default='title')
     eid: str
@@ -111,92 +133,54 @@ class Document(_BaseModel):
 
     @model_validator(mode='before')
     def prevalidate_input_data(cls, document_data: Any) -> Any:
-        if isinstance(document_data, Dict):
-            cls._extract_document_ids(document_data)
-            cls._extract_authors_ids(document_data)
-
-            cls._validate_titles(document_data)
-
-            cls._extract_citations_count(document_data)
-            cls._extract_references_count(document_data)
-
-            return document_data
-        else:
+        if not isinstance(document_data, Dict):
             raise ValidationError('Incorrect document data input')
 
-    @staticmethod
-    def _extract_document_ids(document_data: Dict) -> None:
-        document_ids = document_data.get('databaseDocumentIds', {}) or {}
-        if isinstance(document_ids, Dict):
-            document_data.update(document_ids)
+        _merge_sub_dict(document_data, 'databaseDocumentIds')
 
-    @staticmethod
-    def _extract_authors_ids(document_data: Dict) -> None:
-        authors = document_data.get('authors', []) or []
+        authors = document_data.get('authors') or ()
         if isinstance(authors, List):
             document_data['authors_ids'] = [author.get('authorId') for author in authors
                                             if isinstance(author, Dict) and author.get('authorId')]
 
-    @staticmethod
-    def _validate_titles(document_data: Dict) -> None:
-        def is_valid_title(title_: str) -> bool:
-            return title_ and isinstance(title_, str)
-
-        main_title = document_data.get('title') or None
-        titles = document_data.get('titles', []) or []
-
-        if isinstance(titles, List):
-            titles.append(main_title)
-
-            document_data['titles'] = list({title for title in titles if is_valid_title(title)})
-            if not document_data['titles']:
-                raise ValidationError('No document titles')
-        else:
-            if is_valid_title(main_title):
-                document_data['titles'] = [main_title]
-            else:
-                raise ValidationError('No document titles')
-
-    @staticmethod
-    def _extract_citations_count(document_data: Dict) -> None:
-        citations = document_data.get('citations', {}) or {}
+        citations = document_data.get('citations')
         if isinstance(citations, Dict):
             document_data['citations_count'] = citations.get('count')
 
-    @staticmethod
-    def _extract_references_count(document_data: Dict) -> None:
-        references = document_data.get('references', {}) or {}
+        references = document_data.get('references')
         if isinstance(references, Dict):
             document_data['references_count'] = references.get('count')
 
-    def dump_titles(self) -> List[Dict[str, str]]:
-        return [{'document_id': self.scopus_id, 'title': title} for title in self.titles]
-
-    def dump_abstract_texts(self) -> List[Dict[str, str]]:
-        return [{'document_id': self.scopus_id, 'text': abstract_text} for abstract_text in self.abstract_texts]
+        main_title = document_data.get('title') or None
+        titles = document_data.get('titles') or []
+        if isinstance(titles, List):
+            titles.append(main_title)
+        else:
+            titles = [main_title]
 
-    def dump_subject_areas(self) -> List[Dict[str, Union[str, PositiveInt]]]:
-        return [
-            {'document_id': self.scopus_id, 'subject_area_code': subject_area.code}
-            for subject_area in self.subject_areas
-        ]
+        document_data['titles'] = list(dict.fromkeys(
+            title for title in titles if title and isinstance(title, str)
+        ))
+        if not document_data['titles']:
+            raise ValidationError('No document titles')
 
-    def dump_source_relationship(self) -> Dict:
-        source_relationship = self.source_relationship.model_dump()
-        source_relationship.update({'document_id': self.scopus_id})
-        return source_relationship
+        return document_data
 
-    def dump_source(self) -> Dict[str, str]:
-        return {'document_id': self.scopus_id, 'source_id': self.source.id}
+    def dump_all_children(self) -> Dict[str, Union[Dict, List[Dict], List[Tuple]]]:
+        document_id = self.scopus_id
 
-    def dump_authors(self) -> List[Dict[str, str]]:
-        return [{'document_id': self.scopus_id, 'author_id': author_id} for author_id in self.authors_ids]
+        source_relationship = self.source_relationship.to_insert_dict()
+        source_relationship['document_id'] = document_id
 
-    def dump(self) -> Dict[str, str]:
-        return self.model_dump(
-            by_alias=True,
-            exclude={'titles', 'authors_ids', 'abstract_texts', 'subject_areas', 'source_relationship', 'source'}
-        )
+        return {
+            'titles': list(zip(repeat(document_id), self.titles)),
+            'abstract_texts': list(zip(repeat(document_id), self.abstract_texts)),
+            'authorship': list(zip(repeat(document_id), self.authors_ids)),
+            'subject_areas': [{'document_id': document_id, 'subject_area_code': subject_area.code}
+                              for subject_area in self.subject_areas],
+            'source': {'document_id': document_id, 'source_id': self.source.id},
+            'source_relationship': source_relationship,
+        }
 
 
 class AffiliatedInstitution(_BaseModel):
@@ -215,21 +199,21 @@ class AffiliatedInstitution(_BaseModel):
     @model_validator(mode='before')
     def extract_address(cls, affiliated_institution_data: Any) -> Any:
         if isinstance(affiliated_institution_data, Dict):
-            address = affiliated_institution_data.get('address', {}) or {}
-            if isinstance(address, Dict):
-                affiliated_institution_data.update(address)
+            _merge_sub_dict(affiliated_institution_data, 'address')
 
         return affiliated_institution_data
 
 
 class Author(_BaseModel):
+    _insert_exclude: ClassVar[FrozenSet[str]] = frozenset({'name_variants', 'affiliated_institution', 'subject_areas'})
+
     id: str = Field(validation_alias='authorId')
     eid: str
     orc_id: Optional[str] = Field(default=None, validation_alias='orcId')
 
-    first_name: str = Field(validation_alias='first')
-    last_name: str = Field(validation_alias='last')
-    full_name: str = Field(validation_alias='full')
+    first_name: StrippedStr = Field(validation_alias='first')
+    last_name: StrippedStr = Field(validation_alias='last')
+    full_name: StrippedStr = Field(validation_alias='full')
     name_variants: List[Optional[str]] = Field(default=[], validation_alias='nameVariants')
     email_address: Optional[str] = Field(default=None, validation_alias='emailAddress')
 
@@ -256,9 +240,7 @@ class Author(_BaseModel):
 
     @staticmethod
     def _extract_names(author_data: Dict) -> None:
-        names = author_data.get('preferredName', {}) or {}
-        if isinstance(names, Dict):
-            author_data.update(names)
+        _merge_sub_dict(author_data, 'preferredName')
 
     @staticmethod
     def _extract_affiliated_institution_id(author_data: Dict) -> None:
@@ -276,6 +258,13 @@ class Author(_BaseModel):
         ]
 
 
+DOCUMENT_ADAPTER = TypeAdapter(Document)
+AUTHOR_ADAPTER = TypeAdapter(Author)
+
+validate_document = DOCUMENT_ADAPTER.validate_python
+validate_author = AUTHOR_ADAPTER.validate_python
+
+
 if __name__ == '__main__':
     a = {
         "citations": {
@@ -1,50 +1,187 @@
+import atexit
 from datetime import datetime
-from logging import Formatter, Logger, INFO
-from logging.handlers import RotatingFileHandler
+import logging
+from logging import DEBUG, ERROR, Formatter, getLogger, Logger, INFO
+from glob import escape as glob_escape, glob
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler, WatchedFileHandler
 import os
-from pathlib import Path
+import queue
+import time
 from typing import Union, Optional
 
 
-class ScopusClientLogger(Logger):
-    _current_file: Path = Path(__file__).resolve()
+# the formatter only prints asctime/levelname/message, so skip populating the unused
+# thread/process fields on every LogRecord
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False  # no-op before 3.12
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_LOGS_DIR = os.path.join(_HERE, 'logs')
+
+_logs_dir_ready = set()
+
+
+class _CachedFormatter(Formatter):
+    def __init__(self):
+        super().__init__()
+        self._last_second = -1
+        self._last_prefix = ''
+
+    def format(self, record) -> str:
+        return f'{self.formatTime(record)} - {record.levelname} - {record.getMessage()}'
+
+    def formatTime(self, record, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_prefix = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+            self._last_second = second
+
+        return f'{self._last_prefix},{int(record.msecs):03d}'
+
+
+class _FastRotatingFileHandler(RotatingFileHandler):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+
+    def _should_rollover(self, record_len: int) -> int:
+        if self.maxBytes <= 0:
+            return 0
+
+        self._pending += record_len
+        if self._pending < self.maxBytes:
+            return 0
+
+        if self.stream is None:
+            self.stream = self._open()
+        self._pending = self.stream.tell() + record_len
+        return int(self._pending >= self.maxBytes)
+
+    def doRollover(self) -> None:
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        suffix = int(time.time())
+        segment_name = f'{self.baseFilename}.{suffix}'
+        while os.path.exists(segment_name):
+            suffix += 1
+            segment_name = f'{self.baseFilename}.{suffix}'
+        os.replace(self.baseFilename, segment_name)
 
-    _instance: Optional['ScopusClientLogger'] = None
+        if self.backupCount > 0:
+            segments = sorted(glob(f'{glob_escape(self.baseFilename)}.*'), key=os.path.getmtime)
+            for old_segment in segments[:-self.backupCount]:
+                os.remove(old_segment)
 
-    def __new__(cls, name: str = 'ScopusClient', level: Union[int, str] = INFO):
-        if cls._instance is None:
-            cls._instance = super(ScopusClientLogger, cls).__new__(cls)
-            cls._instance.__init__(name, level)
-        return cls._instance
+        self.stream = self._open()
+        self._pending = 0
+
+    def _open(self):
+        return open(self.baseFilename, 'ab', buffering=1 << 16)
+
+    def emit(self, record) -> None:
+        try:
+            msg = (self.format(record) + self.terminator).encode('utf-8')
+            if self._should_rollover(len(msg)):
+                self.doRollover()
+                self._pending = len(msg)
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            if record.levelno >= ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class ScopusClientLogger(Logger):
+    _logs_filename: Optional[str] = None
+
+    use_external_rotation: bool = False
 
     def __init__(self, name: str = 'ScopusClient', level: Union[int, str] = INFO):
         self._level = level
 
-        logs_dir = ScopusClientLogger._current_file.parent / 'logs'
-        os.makedirs(logs_dir, exist_ok=True)
-        self._logs_filename = os.path.join(
-            logs_dir,
-            f'scopus_client_{datetime.now().strftime(format="%Y-%m-%d_%H-%M-%S")}.log'
-        )
+        if _LOGS_DIR not in _logs_dir_ready:
+            os.makedirs(_LOGS_DIR, exist_ok=True)
+            _logs_dir_ready.add(_LOGS_DIR)
+        if ScopusClientLogger._logs_filename is None:
+            timestamp = datetime.now().isoformat(timespec='seconds').replace(':', '-').replace('T', '_')
+            ScopusClientLogger._logs_filename = os.path.join(_LOGS_DIR, f'scopus_client_{timestamp}.log')
+        self._logs_filename = ScopusClientLogger._logs_filename
 
         super().__init__(name=name, level=level)
         self._add_file_handler()
+        self._refresh_level_flags()
+
+    def findCaller(self, stack_info: bool = False, stacklevel: int = 1):
+        # the installed formatter never uses filename/lineno/funcName, so skip the frame walk
+        return '(unknown file)', 0, '(unknown function)', None
+
+    def setLevel(self, level: Union[int, str]) -> None:
+        super().setLevel(level)
+        # manager._clear_cache() only reaches registered loggers, so clear this one's cache directly
+        self._cache.clear()
+        self._refresh_level_flags()
+
+    def _refresh_level_flags(self) -> None:
+        self.debug_enabled = self.isEnabledFor(DEBUG)
+        self.info_enabled = self.isEnabledFor(INFO)
 
     def _add_file_handler(self) -> None:
-        file_handler = RotatingFileHandler(
-            filename=self._logs_filename,
-            mode='a',
-            maxBytes=10 * 1024 * 1024,
-            backupCount=5,
-            encoding='utf-8'
-        )
+        if self.use_external_rotation:
+            # rotation is delegated to logrotate; /etc/logrotate.d/scopus_client:
+            #   <logs dir>/*.log { size 10M; rotate 5; compress; missingok; notifempty }
+            # WatchedFileHandler reopens the file after the external rename, so the emit
+            # path carries no rotation check at all
+            file_handler = WatchedFileHandler(filename=self._logs_filename, encoding='utf-8')
+        else:
+            file_handler = _FastRotatingFileHandler(
+                filename=self._logs_filename,
+                mode='a',
+                maxBytes=10 * 1024 * 1024,
+                backupCount=5,
+                encoding='utf-8'
+            )
         file_handler.setLevel(self._level)
-        file_handler.setFormatter(Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        file_handler.setFormatter(_CachedFormatter())
+
+        memory_handler = MemoryHandler(capacity=1024, flushLevel=ERROR, target=file_handler, flushOnClose=True)
+        atexit.register(memory_handler.flush)
+
+        log_queue = queue.SimpleQueue()
+        self._listener = QueueListener(log_queue, memory_handler, respect_handler_level=True)
+        self._listener.start()
+        atexit.register(self._listener.stop)
+
+        self.addHandler(QueueHandler(log_queue))
+        self.propagate = False
+
+
+def get_scopus_logger(
+        name: str = 'ScopusClient',
+        level: Union[int, str] = INFO,
+        use_external_rotation: bool = False
+) -> ScopusClientLogger:
+    logger = Logger.manager.loggerDict.get(name)
+    if isinstance(logger, ScopusClientLogger):
+        return logger
+
+    ScopusClientLogger.use_external_rotation = use_external_rotation
+    Logger.manager.setLoggerClass(ScopusClientLogger)
+    try:
+        logger = getLogger(name)
+    finally:
+        Logger.manager.loggerClass = None
 
-        self.addHandler(file_handler)
+    logger.setLevel(level)
+    return logger
 
 
 if __name__ == '__main__':
-    print(ScopusClientLogger().__hash__())
-    print(ScopusClientLogger().__hash__())
+    print(get_scopus_logger().__hash__())
+    print(get_scopus_logger().__hash__())
 